@@ -1110,11 +1110,12 @@ class AudioRegion(object):
             return True
         if not isinstance(other, AudioRegion):
             return False
+        # compare audio parameters first, they are cheaper to check than data
         return (
-            (self.data == other.data)
-            and (self.sr == other.sr)
+            (self.sr == other.sr)
             and (self.sw == other.sw)
             and (self.ch == other.ch)
+            and (self.data == other.data)
         )
 
     def __getitem__(self, index):
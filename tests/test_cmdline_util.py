@@ -59,6 +59,79 @@ _ArgsNamespace = namedtuple(
 )
 
 
+_BASE_ARGS_NS = _ArgsNamespace(
+    input="file",
+    max_read=30,
+    analysis_window=0.01,
+    sampling_rate=16000,
+    sample_width=2,
+    channels=2,
+    use_channel=None,
+    input_format="raw",
+    output_format="ogg",
+    large_file=True,
+    frame_per_buffer=None,
+    input_device_index=1,
+    save_stream=None,
+    save_detections_as=None,
+    join_detections=None,
+    plot=False,
+    save_image=None,
+    min_duration=0.2,
+    max_duration=10,
+    max_silence=0.3,
+    drop_trailing_silence=False,
+    strict_min_duration=False,
+    energy_threshold=55,
+    echo=False,
+    progress_bar=False,
+    command=None,
+    quiet=True,
+    printf=None,
+    time_format="TIME_FORMAT",
+    timestamp_format="TIMESTAMP_FORMAT",
+)
+
+_BASE_IO_KWARGS = {
+    "input": "file",
+    "max_read": 30,
+    "block_dur": 0.01,
+    "sampling_rate": 16000,
+    "sample_width": 2,
+    "channels": 2,
+    "audio_format": "raw",
+    "export_format": "ogg",
+    "large_file": True,
+    "frames_per_buffer": None,
+    "input_device_index": 1,
+}
+
+_SPLIT_KWARGS = {
+    "min_dur": 0.2,
+    "max_dur": 10,
+    "max_silence": 0.3,
+    "drop_trailing_silence": False,
+    "strict_min_dur": False,
+    "energy_threshold": 55,
+}
+
+_MISC_KWARGS = {
+    "echo": False,
+    "command": None,
+    "progress_bar": False,
+    "quiet": True,
+    "printf": None,
+    "time_format": "TIME_FORMAT",
+    "timestamp_format": "TIMESTAMP_FORMAT",
+}
+
+
+@pytest.fixture
+def patched_player_for():
+    with patch("auditok.cmdline_util.player_for") as patched_player_for:
+        yield patched_player_for
+
+
 @pytest.mark.parametrize(
     "save_stream, save_detections_as, join_detections, plot, save_image, use_channel, exp_use_channel, exp_record",  # noqa: B950
     [
@@ -97,121 +170,32 @@ def test_make_kwargs(
     exp_use_channel,
     exp_record,
 ):
-    args = (
-        "file",
-        30,
-        0.01,
-        16000,
-        2,
-        2,
-        use_channel,
-        "raw",
-        "ogg",
-        True,
-        None,
-        1,
-        save_stream,
-        save_detections_as,
-        join_detections,
-        plot,
-        save_image,
-        0.2,
-        10,
-        0.3,
-        False,
-        False,
-        55,
-    )
-    misc = (
-        False,
-        False,
-        None,
-        True,
-        None,
-        "TIME_FORMAT",
-        "TIMESTAMP_FORMAT",
+    args_ns = _BASE_ARGS_NS._replace(
+        use_channel=use_channel,
+        save_stream=save_stream,
+        save_detections_as=save_detections_as,
+        join_detections=join_detections,
+        plot=plot,
+        save_image=save_image,
     )
-    args_ns = _ArgsNamespace(*(args + misc))
 
     io_kwargs = {
-        "input": "file",
-        "max_read": 30,
-        "block_dur": 0.01,
-        "sampling_rate": 16000,
-        "sample_width": 2,
-        "channels": 2,
+        **_BASE_IO_KWARGS,
         "use_channel": exp_use_channel,
         "save_stream": save_stream,
         "save_detections_as": save_detections_as,
         "join_detections": join_detections,
-        "audio_format": "raw",
-        "export_format": "ogg",
-        "large_file": True,
-        "frames_per_buffer": None,
-        "input_device_index": 1,
         "record": exp_record,
     }
-
-    split_kwargs = {
-        "min_dur": 0.2,
-        "max_dur": 10,
-        "max_silence": 0.3,
-        "drop_trailing_silence": False,
-        "strict_min_dur": False,
-        "energy_threshold": 55,
-    }
-
-    miscellaneous = {
-        "echo": False,
-        "command": None,
-        "progress_bar": False,
-        "quiet": True,
-        "printf": None,
-        "time_format": "TIME_FORMAT",
-        "timestamp_format": "TIMESTAMP_FORMAT",
-    }
-
-    expected = KeywordArguments(io_kwargs, split_kwargs, miscellaneous)
+    expected = KeywordArguments(io_kwargs, _SPLIT_KWARGS, _MISC_KWARGS)
     kwargs = make_kwargs(args_ns)
     assert kwargs == expected
 
 
 def test_make_kwargs_error():
-
-    args = (
-        "file",
-        30,
-        0.01,
-        16000,
-        2,
-        2,
-        1,
-        "raw",
-        "ogg",
-        True,
-        None,
-        1,
-        None,  # save_stream
-        None,
-        1.0,  # join_detections
-        None,
-        None,
-        0.2,
-        10,
-        0.3,
-        False,
-        False,
-        55,
-        False,
-        False,
-        None,
-        True,
-        None,
-        "TIME_FORMAT",
-        "TIMESTAMP_FORMAT",
+    args_ns = _BASE_ARGS_NS._replace(
+        use_channel=1, save_stream=None, join_detections=1.0
     )
-
-    args_ns = _ArgsNamespace(*args)
     expected_err_msg = "using --join-detections/-j requires "
     expected_err_msg += "--save-stream/-O to be specified."
     with pytest.raises(ArgumentError) as arg_err:
@@ -219,16 +203,19 @@ def test_make_kwargs_error():
     assert str(arg_err.value) == expected_err_msg
 
 
-def test_make_logger_stderr_and_file(capsys):
-    with TemporaryDirectory() as tmpdir:
-        file = os.path.join(tmpdir, "file.log")
-        logger = make_logger(stderr=True, file=file)
+def test_make_logger_stderr_and_file(capsys, tmp_path):
+    file = str(tmp_path / "file.log")
+    logger = make_logger(stderr=True, file=file)
+    try:
         assert logger.name == _AUDITOK_LOGGER
         assert len(logger.handlers) == 2
         assert logger.handlers[1].stream.name == file
         logger.info("This is a debug message")
-        captured = capsys.readouterr()
-        assert "This is a debug message" in captured.err
+        assert "This is a debug message" in capsys.readouterr().err
+    finally:
+        for handler in logger.handlers[:]:
+            handler.close()
+            logger.removeHandler(handler)
 
 
 def test_make_logger_None():
@@ -236,199 +223,184 @@ def test_make_logger_None():
     assert logger is None
 
 
-def test_initialize_workers_all_plus_full_stream_saver():
-    with patch("auditok.cmdline_util.player_for") as patched_player_for:
-        with TemporaryDirectory() as tmpdir:
-            export_filename = os.path.join(tmpdir, "output.wav")
-            reader, tokenizer_worker = initialize_workers(
-                input="tests/data/test_16KHZ_mono_400Hz.wav",
-                save_stream=export_filename,
-                export_format="wave",
-                save_detections_as="{id}.wav",
-                join_detections=None,
-                echo=True,
-                progress_bar=False,
-                command="some command",
-                quiet=False,
-                printf="abcd",
-                time_format="%S",
-                timestamp_format="%h:%M:%S",
-            )
-            reader.stop()
-            assert patched_player_for.called
-            assert isinstance(reader, StreamSaverWorker)
-            for obs, cls in zip(
-                tokenizer_worker._observers,
-                [
-                    RegionSaverWorker,
-                    PlayerWorker,
-                    CommandLineWorker,
-                    PrintWorker,
-                ],
-            ):
-                assert isinstance(obs, cls)
-
-
-def test_initialize_workers_all_plus_audio_event_joiner():
-    with patch("auditok.cmdline_util.player_for") as patched_player_for:
-        with TemporaryDirectory() as tmpdir:
-            export_filename = os.path.join(tmpdir, "output.wav")
-            reader, tokenizer_worker = initialize_workers(
-                input="tests/data/test_16KHZ_mono_400Hz.wav",
-                save_stream=export_filename,
-                export_format="wave",
-                save_detections_as="{id}.wav",
-                join_detections=1,
-                echo=True,
-                progress_bar=False,
-                command="some command",
-                quiet=False,
-                printf="abcd",
-                time_format="%S",
-                timestamp_format="%h:%M:%S",
-            )
-            assert patched_player_for.called
-            assert not isinstance(reader, StreamSaverWorker)
-            for obs, cls in zip(
-                tokenizer_worker._observers,
-                [
-                    AudioEventsJoinerWorker,
-                    RegionSaverWorker,
-                    PlayerWorker,
-                    CommandLineWorker,
-                    PrintWorker,
-                ],
-            ):
-                assert isinstance(obs, cls)
-
-
-def test_initialize_workers_no_RegionSaverWorker():
-    with patch("auditok.cmdline_util.player_for") as patched_player_for:
-        with TemporaryDirectory() as tmpdir:
-            export_filename = os.path.join(tmpdir, "output.wav")
-            reader, tokenizer_worker = initialize_workers(
-                input="tests/data/test_16KHZ_mono_400Hz.wav",
-                save_stream=export_filename,
-                export_format="wave",
-                save_detections_as=None,
-                join_detections=None,
-                echo=True,
-                progress_bar=False,
-                command="some command",
-                quiet=False,
-                printf="abcd",
-                time_format="%S",
-                timestamp_format="%h:%M:%S",
-            )
-            reader.stop()
-            assert patched_player_for.called
-            assert isinstance(reader, StreamSaverWorker)
-            for obs, cls in zip(
-                tokenizer_worker._observers,
-                [PlayerWorker, CommandLineWorker, PrintWorker],
-            ):
-                assert isinstance(obs, cls)
-
-
-def test_initialize_workers_no_PlayerWorker():
-    with patch("auditok.cmdline_util.player_for") as patched_player_for:
-        with TemporaryDirectory() as tmpdir:
-            export_filename = os.path.join(tmpdir, "output.wav")
-            reader, tokenizer_worker = initialize_workers(
-                input="tests/data/test_16KHZ_mono_400Hz.wav",
-                save_stream=export_filename,
-                export_format="wave",
-                save_detections_as="{id}.wav",
-                join_detections=None,
-                echo=False,
-                progress_bar=False,
-                command="some command",
-                quiet=False,
-                printf="abcd",
-                time_format="%S",
-                timestamp_format="%h:%M:%S",
-            )
-            reader.stop()
-            assert not patched_player_for.called
-            assert isinstance(reader, StreamSaverWorker)
-            for obs, cls in zip(
-                tokenizer_worker._observers,
-                [RegionSaverWorker, CommandLineWorker, PrintWorker],
-            ):
-                assert isinstance(obs, cls)
-
-
-def test_initialize_workers_no_CommandLineWorker():
-    with patch("auditok.cmdline_util.player_for") as patched_player_for:
-        with TemporaryDirectory() as tmpdir:
-            export_filename = os.path.join(tmpdir, "output.wav")
-            reader, tokenizer_worker = initialize_workers(
-                input="tests/data/test_16KHZ_mono_400Hz.wav",
-                save_stream=export_filename,
-                export_format="wave",
-                save_detections_as="{id}.wav",
-                join_detections=None,
-                echo=True,
-                progress_bar=False,
-                command=None,
-                quiet=False,
-                printf="abcd",
-                time_format="%S",
-                timestamp_format="%h:%M:%S",
-            )
-            reader.stop()
-            assert patched_player_for.called
-            assert isinstance(reader, StreamSaverWorker)
-            for obs, cls in zip(
-                tokenizer_worker._observers,
-                [RegionSaverWorker, PlayerWorker, PrintWorker],
-            ):
-                assert isinstance(obs, cls)
-
-
-def test_initialize_workers_no_PrintWorker():
-    with patch("auditok.cmdline_util.player_for") as patched_player_for:
-        with TemporaryDirectory() as tmpdir:
-            export_filename = os.path.join(tmpdir, "output.wav")
-            reader, tokenizer_worker = initialize_workers(
-                input="tests/data/test_16KHZ_mono_400Hz.wav",
-                save_stream=export_filename,
-                export_format="wave",
-                save_detections_as="{id}.wav",
-                join_detections=None,
-                echo=True,
-                progress_bar=False,
-                command="some command",
-                quiet=True,
-                printf="abcd",
-                time_format="%S",
-                timestamp_format="%h:%M:%S",
-            )
-            reader.stop()
-            assert patched_player_for.called
-            assert isinstance(reader, StreamSaverWorker)
-            for obs, cls in zip(
-                tokenizer_worker._observers,
-                [RegionSaverWorker, PlayerWorker, CommandLineWorker],
-            ):
-                assert isinstance(obs, cls)
-
-
-def test_initialize_workers_no_observers():
-    with patch("auditok.cmdline_util.player_for") as patched_player_for:
+def test_initialize_workers_all_plus_full_stream_saver(patched_player_for):
+    with TemporaryDirectory() as tmpdir:
+        export_filename = os.path.join(tmpdir, "output.wav")
+        reader, tokenizer_worker = initialize_workers(
+            input="tests/data/test_16KHZ_mono_400Hz.wav",
+            save_stream=export_filename,
+            export_format="wave",
+            save_detections_as="{id}.wav",
+            join_detections=None,
+            echo=True,
+            progress_bar=False,
+            command="some command",
+            quiet=False,
+            printf="abcd",
+            time_format="%S",
+            timestamp_format="%h:%M:%S",
+        )
+        reader.stop()
+        assert patched_player_for.called
+        assert isinstance(reader, StreamSaverWorker)
+        assert tuple(map(type, tokenizer_worker._observers)) == (
+            RegionSaverWorker,
+            PlayerWorker,
+            CommandLineWorker,
+            PrintWorker,
+        )
+
+
+def test_initialize_workers_all_plus_audio_event_joiner(patched_player_for):
+    with TemporaryDirectory() as tmpdir:
+        export_filename = os.path.join(tmpdir, "output.wav")
+        reader, tokenizer_worker = initialize_workers(
+            input="tests/data/test_16KHZ_mono_400Hz.wav",
+            save_stream=export_filename,
+            export_format="wave",
+            save_detections_as="{id}.wav",
+            join_detections=1,
+            echo=True,
+            progress_bar=False,
+            command="some command",
+            quiet=False,
+            printf="abcd",
+            time_format="%S",
+            timestamp_format="%h:%M:%S",
+        )
+        assert patched_player_for.called
+        assert not isinstance(reader, StreamSaverWorker)
+        assert tuple(map(type, tokenizer_worker._observers)) == (
+            AudioEventsJoinerWorker,
+            RegionSaverWorker,
+            PlayerWorker,
+            CommandLineWorker,
+            PrintWorker,
+        )
+
+
+def test_initialize_workers_no_RegionSaverWorker(patched_player_for):
+    with TemporaryDirectory() as tmpdir:
+        export_filename = os.path.join(tmpdir, "output.wav")
         reader, tokenizer_worker = initialize_workers(
             input="tests/data/test_16KHZ_mono_400Hz.wav",
-            save_stream=None,
+            save_stream=export_filename,
             export_format="wave",
             save_detections_as=None,
+            join_detections=None,
+            echo=True,
+            progress_bar=False,
+            command="some command",
+            quiet=False,
+            printf="abcd",
+            time_format="%S",
+            timestamp_format="%h:%M:%S",
+        )
+        reader.stop()
+        assert patched_player_for.called
+        assert isinstance(reader, StreamSaverWorker)
+        assert tuple(map(type, tokenizer_worker._observers)) == (
+            PlayerWorker,
+            CommandLineWorker,
+            PrintWorker,
+        )
+
+
+def test_initialize_workers_no_PlayerWorker(patched_player_for):
+    with TemporaryDirectory() as tmpdir:
+        export_filename = os.path.join(tmpdir, "output.wav")
+        reader, tokenizer_worker = initialize_workers(
+            input="tests/data/test_16KHZ_mono_400Hz.wav",
+            save_stream=export_filename,
+            export_format="wave",
+            save_detections_as="{id}.wav",
+            join_detections=None,
+            echo=False,
+            progress_bar=False,
+            command="some command",
+            quiet=False,
+            printf="abcd",
+            time_format="%S",
+            timestamp_format="%h:%M:%S",
+        )
+        reader.stop()
+        assert not patched_player_for.called
+        assert isinstance(reader, StreamSaverWorker)
+        assert tuple(map(type, tokenizer_worker._observers)) == (
+            RegionSaverWorker,
+            CommandLineWorker,
+            PrintWorker,
+        )
+
+
+def test_initialize_workers_no_CommandLineWorker(patched_player_for):
+    with TemporaryDirectory() as tmpdir:
+        export_filename = os.path.join(tmpdir, "output.wav")
+        reader, tokenizer_worker = initialize_workers(
+            input="tests/data/test_16KHZ_mono_400Hz.wav",
+            save_stream=export_filename,
+            export_format="wave",
+            save_detections_as="{id}.wav",
+            join_detections=None,
             echo=True,
             progress_bar=False,
             command=None,
+            quiet=False,
+            printf="abcd",
+            time_format="%S",
+            timestamp_format="%h:%M:%S",
+        )
+        reader.stop()
+        assert patched_player_for.called
+        assert isinstance(reader, StreamSaverWorker)
+        assert tuple(map(type, tokenizer_worker._observers)) == (
+            RegionSaverWorker,
+            PlayerWorker,
+            PrintWorker,
+        )
+
+
+def test_initialize_workers_no_PrintWorker(patched_player_for):
+    with TemporaryDirectory() as tmpdir:
+        export_filename = os.path.join(tmpdir, "output.wav")
+        reader, tokenizer_worker = initialize_workers(
+            input="tests/data/test_16KHZ_mono_400Hz.wav",
+            save_stream=export_filename,
+            export_format="wave",
+            save_detections_as="{id}.wav",
+            join_detections=None,
+            echo=True,
+            progress_bar=False,
+            command="some command",
             quiet=True,
             printf="abcd",
             time_format="%S",
             timestamp_format="%h:%M:%S",
         )
+        reader.stop()
         assert patched_player_for.called
-        assert not isinstance(reader, StreamSaverWorker)
-        assert len(tokenizer_worker._observers) == 1
+        assert isinstance(reader, StreamSaverWorker)
+        assert tuple(map(type, tokenizer_worker._observers)) == (
+            RegionSaverWorker,
+            PlayerWorker,
+            CommandLineWorker,
+        )
+
+
+def test_initialize_workers_no_observers(patched_player_for):
+    reader, tokenizer_worker = initialize_workers(
+        input="tests/data/test_16KHZ_mono_400Hz.wav",
+        save_stream=None,
+        export_format="wave",
+        save_detections_as=None,
+        echo=True,
+        progress_bar=False,
+        command=None,
+        quiet=True,
+        printf="abcd",
+        time_format="%S",
+        timestamp_format="%h:%M:%S",
+    )
+    assert patched_player_for.called
+    assert not isinstance(reader, StreamSaverWorker)
+    assert len(tokenizer_worker._observers) == 1
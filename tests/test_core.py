@@ -1,7 +1,7 @@
 import math
 import os
+from functools import lru_cache
 from pathlib import Path
-from random import random
 from tempfile import TemporaryDirectory
 from unittest import mock
 from unittest.mock import patch
@@ -29,17 +29,108 @@ from auditok.util import AudioReader
 
 mock._magics.add("__round__")
 
+# Zero buffer that make_silence output is compared against through a
+# memoryview, without copying. Large enough to hold 2 seconds of 48KHz,
+# 4-channel, 4-byte audio.
+_ZEROS = bytes(2 * 48000 * 4 * 4)
+
 
 def _make_random_length_regions(
     byte_seq, sampling_rate, sample_width, channels
 ):
-    regions = []
-    for b in byte_seq:
-        duration = round(random() * 10, 6)
-        data = b * int(duration * sampling_rate) * sample_width * channels
-        region = AudioRegion(data, sampling_rate, sample_width, channels)
-        regions.append(region)
-    return regions
+    # fixed seed so that region lengths are the same on every run
+    rng = np.random.default_rng(0)
+    durations = np.round(rng.random(len(byte_seq)) * 10, 6)
+    nb_samples = (durations * sampling_rate).astype(int)
+    return [
+        AudioRegion(
+            b * (int(n) * sample_width * channels),
+            sampling_rate,
+            sample_width,
+            channels,
+        )
+        for b, n in zip(byte_seq, nb_samples)
+    ]
+
+
+def _check_split_regions(
+    regions, regions_ar, expected, data, sample_size_bytes
+):
+    regions = list(regions)
+    regions_ar = list(regions_ar)
+    err_msg = "Wrong number of regions after split, expected: "
+    err_msg += "{}, found: {}".format(len(expected), len(regions))
+    assert len(regions) == len(expected), err_msg
+    err_msg = "Wrong number of regions after AudioRegion.split, expected: "
+    err_msg += "{}, found: {}".format(len(expected), len(regions_ar))
+    assert len(regions_ar) == len(expected), err_msg
+
+    data = memoryview(data)
+    for reg, reg_ar, (onset, offset) in zip(regions, regions_ar, expected):
+        assert len(reg.data) == (offset - onset) * sample_size_bytes
+        assert reg == reg_ar
+    exp_data = b"".join(
+        data[onset * sample_size_bytes : offset * sample_size_bytes]
+        for onset, offset in expected
+    )
+    assert b"".join(reg.data for reg in regions) == exp_data
+
+
+def _nb_bytes(duration, sampling_rate, sample_width, channels):
+    # Round to a whole number of samples first, as auditok does, so that the
+    # result is always a multiple of the sample size.
+    return round(duration * sampling_rate) * sample_width * channels
+
+
+@lru_cache(maxsize=None)
+def _make_ab_region(nb_a, nb_b, sampling_rate, sample_width, channels):
+    # Region made of `nb_a` b"a" bytes followed by `nb_b` b"b" bytes, shared
+    # by all slicing tests that use the same parameters.
+    data = b"a" * nb_a + b"b" * nb_b
+    return AudioRegion(data, sampling_rate, sample_width, channels)
+
+
+@pytest.fixture(scope="module")
+def mono_raw():
+    return Path("tests/data/test_split_10HZ_mono.raw").read_bytes()
+
+
+@pytest.fixture(scope="module")
+def stereo_raw():
+    return Path("tests/data/test_split_10HZ_stereo.raw").read_bytes()
+
+
+@pytest.fixture(scope="module")
+def mono_region(mono_raw):
+    return AudioRegion(mono_raw, 10, 2, 1)
+
+
+@pytest.fixture(scope="module")
+def stereo_region(stereo_raw):
+    return AudioRegion(stereo_raw, 10, 2, 2)
+
+
+@pytest.fixture
+def split_input(request, stereo_raw, stereo_region):
+    # Named inputs are only built when the test case that uses them runs;
+    # any other value (e.g. a file name) is used as is. Readers and sources
+    # are created for each case and closed once it's done.
+    filename = "tests/data/test_split_10HZ_stereo.raw"
+    if request.param == "bytes":
+        yield stereo_raw
+    elif request.param == "audio_region":
+        yield stereo_region
+    elif request.param in ("audio_reader", "audio_source"):
+        if request.param == "audio_reader":
+            input = AudioReader(filename, sr=10, sw=2, ch=2, block_dur=0.1)
+        else:
+            input = get_audio_source(filename, sr=10, sw=2, ch=2)
+        try:
+            yield input
+        finally:
+            input.close()
+    else:
+        yield request.param
 
 
 @pytest.mark.parametrize(
@@ -63,7 +154,7 @@ def _make_random_length_regions(
         "skip_2_4_read_3_5_stereo",
     ],
 )
-def test_load(skip, max_read, channels):
+def test_load(skip, max_read, channels, mono_raw, stereo_raw):
     sampling_rate = 10
     sample_width = 2
     filename = "tests/data/test_split_10HZ_{}.raw"
@@ -76,13 +167,13 @@ def test_load(skip, max_read, channels):
         sw=sample_width,
         ch=channels,
     )
-    with open(filename, "rb") as fp:
-        fp.read(round(skip * sampling_rate * sample_width * channels))
-        if max_read is None or max_read < 0:
-            to_read = -1
-        else:
-            to_read = round(max_read * sampling_rate * sample_width * channels)
-        expected = fp.read(to_read)
+    data = mono_raw if channels == 1 else stereo_raw
+    onset = _nb_bytes(skip, sampling_rate, sample_width, channels)
+    if max_read is None or max_read < 0:
+        expected = data[onset:]
+    else:
+        to_read = _nb_bytes(max_read, sampling_rate, sample_width, channels)
+        expected = data[onset : onset + to_read]
     assert bytes(region) == expected
 
 
@@ -107,11 +198,10 @@ def test_load(skip, max_read, channels):
 )
 def test_make_silence(duration, sampling_rate, sample_width, channels):
     silence = make_silence(duration, sampling_rate, sample_width, channels)
-    size = round(duration * sampling_rate) * sample_width * channels
-    expected_data = b"\0" * size
+    size = _nb_bytes(duration, sampling_rate, sample_width, channels)
     expected_duration = size / (sampling_rate * sample_width * channels)
     assert silence.duration == expected_duration
-    assert silence.data == expected_data
+    assert memoryview(silence.data) == memoryview(_ZEROS)[:size]
 
 
 @pytest.mark.parametrize(
@@ -133,26 +223,25 @@ def test_split_and_join_with_silence(duration):
     sample_width = 2
     channels = 1
 
-    regions = split(
-        input="tests/data/test_split_10HZ_mono.raw",
-        min_dur=0.2,
-        max_dur=5,
-        max_silence=0.2,
-        drop_trailing_silence=False,
-        strict_min_dur=False,
-        analysis_window=0.1,
-        sr=sampling_rate,
-        sw=sample_width,
-        ch=channels,
-        eth=50,
+    regions = list(
+        split(
+            input="tests/data/test_split_10HZ_mono.raw",
+            min_dur=0.2,
+            max_dur=5,
+            max_silence=0.2,
+            drop_trailing_silence=False,
+            strict_min_dur=False,
+            analysis_window=0.1,
+            sr=sampling_rate,
+            sw=sample_width,
+            ch=channels,
+            eth=50,
+        )
     )
 
-    size = round(duration * sampling_rate) * sample_width * channels
-    join_data = b"\0" * size
+    size = _nb_bytes(duration, sampling_rate, sample_width, channels)
+    join_data = bytes(size)
     expected_data = join_data.join(region.data for region in regions)
-    expected_region = AudioRegion(
-        expected_data, sampling_rate, sample_width, channels
-    )
 
     region_with_silence = split_and_join_with_silence(
         input="tests/data/test_split_10HZ_mono.raw",
@@ -168,21 +257,22 @@ def test_split_and_join_with_silence(duration):
         ch=channels,
         eth=50,
     )
-    assert region_with_silence == expected_region
+    assert region_with_silence.sampling_rate == sampling_rate
+    assert region_with_silence.sample_width == sample_width
+    assert region_with_silence.channels == channels
+    assert region_with_silence.data == expected_data
 
 
 @pytest.mark.parametrize(
     "duration, analysis_window, round_fn, expected, kwargs",
     [
-        (0, 1, None, 0, None),  # zero_duration
-        (0.3, 0.1, round, 3, None),  # multiple
-        (0.35, 0.1, math.ceil, 4, None),  # not_multiple_ceil
-        (0.35, 0.1, math.floor, 3, None),  # not_multiple_floor
-        (0.05, 0.1, round, 0, None),  # small_duration
-        (0.05, 0.1, math.ceil, 1, None),  # small_duration_ceil
+        (0, 1, None, 0, {}),  # zero_duration
+        (0.3, 0.1, round, 3, {}),  # multiple
+        (0.35, 0.1, math.ceil, 4, {}),  # not_multiple_ceil
+        (0.35, 0.1, math.floor, 3, {}),  # not_multiple_floor
+        (0.05, 0.1, round, 0, {}),  # small_duration
+        (0.05, 0.1, math.ceil, 1, {}),  # small_duration_ceil
         (0.3, 0.1, math.floor, 3, {"epsilon": 1e-6}),  # with_round_error
-        (-0.5, 0.1, math.ceil, ValueError, None),  # negative_duration
-        (0.5, -0.1, math.ceil, ValueError, None),  # negative_analysis_window
     ],
     ids=[
         "zero_duration",
@@ -192,23 +282,31 @@ def test_split_and_join_with_silence(duration):
         "small_duration",
         "small_duration_ceil",
         "with_round_error",
-        "negative_duration",
-        "negative_analysis_window",
     ],
 )
 def test_duration_to_nb_windows(
     duration, analysis_window, round_fn, expected, kwargs
 ):
-    if expected == ValueError:
-        with pytest.raises(ValueError):
-            _duration_to_nb_windows(duration, analysis_window, round_fn)
-    else:
-        if kwargs is None:
-            kwargs = {}
-        result = _duration_to_nb_windows(
-            duration, analysis_window, round_fn, **kwargs
-        )
-        assert result == expected
+    result = _duration_to_nb_windows(
+        duration, analysis_window, round_fn, **kwargs
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "duration, analysis_window",
+    [
+        (-0.5, 0.1),  # negative_duration
+        (0.5, -0.1),  # negative_analysis_window
+    ],
+    ids=[
+        "negative_duration",
+        "negative_analysis_window",
+    ],
+)
+def test_duration_to_nb_windows_exception(duration, analysis_window):
+    with pytest.raises(ValueError):
+        _duration_to_nb_windows(duration, analysis_window, math.ceil)
 
 
 @pytest.mark.parametrize(
@@ -234,19 +332,18 @@ def test_duration_to_nb_windows(
         "stereo_skip_2_max_read_3",
     ],
 )
-def test_read_offline(channels, skip, max_read):
+def test_read_offline(channels, skip, max_read, mono_raw, stereo_raw):
     sampling_rate = 10
     sample_width = 2
     mono_or_stereo = "mono" if channels == 1 else "stereo"
     filename = "tests/data/test_split_10HZ_{}.raw".format(mono_or_stereo)
-    with open(filename, "rb") as fp:
-        data = fp.read()
-    onset = round(skip * sampling_rate * sample_width * channels)
+    data = mono_raw if channels == 1 else stereo_raw
+    onset = _nb_bytes(skip, sampling_rate, sample_width, channels)
     if max_read in (-1, None):
         offset = len(data) + 1
     else:
-        offset = onset + round(
-            max_read * sampling_rate * sample_width * channels
+        offset = onset + _nb_bytes(
+            max_read, sampling_rate, sample_width, channels
         )
     expected_data = data[onset:offset]
     read_data, *audio_params = _read_offline(
@@ -373,9 +470,10 @@ def test_split_params(
     strict_min_dur,
     kwargs,
     expected,
+    mono_raw,
+    mono_region,
 ):
-    with open("tests/data/test_split_10HZ_mono.raw", "rb") as fp:
-        data = fp.read()
+    data = mono_raw
 
     regions = split(
         data,
@@ -391,7 +489,7 @@ def test_split_params(
         **kwargs
     )
 
-    region = AudioRegion(data, 10, 2, 1)
+    region = mono_region
     regions_ar = region.split(
         min_dur,
         max_dur,
@@ -402,21 +500,7 @@ def test_split_params(
         **kwargs
     )
 
-    regions = list(regions)
-    regions_ar = list(regions_ar)
-    err_msg = "Wrong number of regions after split, expected: "
-    err_msg += "{}, found: {}".format(len(expected), len(regions))
-    assert len(regions) == len(expected), err_msg
-    err_msg = "Wrong number of regions after AudioRegion.split, expected: "
-    err_msg += "{}, found: {}".format(len(expected), len(regions_ar))
-    assert len(regions_ar) == len(expected), err_msg
-
-    sample_width = 2
-    for reg, reg_ar, exp in zip(regions, regions_ar, expected):
-        onset, offset = exp
-        exp_data = data[onset * sample_width : offset * sample_width]
-        assert bytes(reg) == exp_data
-        assert reg == reg_ar
+    _check_split_regions(regions, regions_ar, expected, data, 2)
 
 
 @pytest.mark.parametrize(
@@ -492,12 +576,10 @@ def test_split_params(
         "stereo_uc_mix_default_eth",
     ],
 )
-def test_split_kwargs(channels, kwargs, expected):
-
-    mono_or_stereo = "mono" if channels == 1 else "stereo"
-    filename = "tests/data/test_split_10HZ_{}.raw".format(mono_or_stereo)
-    with open(filename, "rb") as fp:
-        data = fp.read()
+def test_split_kwargs(
+    channels, kwargs, expected, mono_raw, stereo_raw, mono_region, stereo_region
+):
+    data = mono_raw if channels == 1 else stereo_raw
 
     regions = split(
         data,
@@ -513,12 +595,14 @@ def test_split_kwargs(channels, kwargs, expected):
         **kwargs
     )
 
-    region = AudioRegion(data, 10, 2, channels)
+    region = mono_region if channels == 1 else stereo_region
     max_read = kwargs.get("max_read", kwargs.get("mr"))
     if max_read is not None:
         region = region.sec[:max_read]
-        kwargs.pop("max_read", None)
-        kwargs.pop("mr", None)
+        # don't mutate the parametrized dict, it's shared across runs
+        kwargs = {
+            k: v for k, v in kwargs.items() if k not in ("max_read", "mr")
+        }
 
     regions_ar = region.split(
         min_dur=0.2,
@@ -530,26 +614,7 @@ def test_split_kwargs(channels, kwargs, expected):
         **kwargs
     )
 
-    regions = list(regions)
-    regions_ar = list(regions_ar)
-    err_msg = "Wrong number of regions after split, expected: "
-    err_msg += "{}, found: {}".format(len(expected), len(regions))
-    assert len(regions) == len(expected), err_msg
-    err_msg = "Wrong number of regions after AudioRegion.split, expected: "
-    err_msg += "{}, found: {}".format(len(expected), len(regions_ar))
-    assert len(regions_ar) == len(expected), err_msg
-
-    sample_width = 2
-    sample_size_bytes = sample_width * channels
-    for reg, reg_ar, exp in zip(
-        regions,
-        regions_ar,
-        expected,
-    ):
-        onset, offset = exp
-        exp_data = data[onset * sample_size_bytes : offset * sample_size_bytes]
-        assert len(bytes(reg)) == len(exp_data)
-        assert reg == reg_ar
+    _check_split_regions(regions, regions_ar, expected, data, 2 * channels)
 
 
 @pytest.mark.parametrize(
@@ -922,13 +987,18 @@ def test_split_kwargs(channels, kwargs, expected):
     ],
 )
 def test_split_analysis_window(
-    min_dur, max_dur, max_silence, channels, kwargs, expected
+    min_dur,
+    max_dur,
+    max_silence,
+    channels,
+    kwargs,
+    expected,
+    mono_raw,
+    stereo_raw,
+    mono_region,
+    stereo_region,
 ):
-
-    mono_or_stereo = "mono" if channels == 1 else "stereo"
-    filename = "tests/data/test_split_10HZ_{}.raw".format(mono_or_stereo)
-    with open(filename, "rb") as fp:
-        data = fp.read()
+    data = mono_raw if channels == 1 else stereo_raw
 
     regions = split(
         data,
@@ -944,7 +1014,7 @@ def test_split_analysis_window(
         **kwargs
     )
 
-    region = AudioRegion(data, 10, 2, channels)
+    region = mono_region if channels == 1 else stereo_region
     regions_ar = region.split(
         min_dur=min_dur,
         max_dur=max_dur,
@@ -955,32 +1025,14 @@ def test_split_analysis_window(
         **kwargs
     )
 
-    regions = list(regions)
-    regions_ar = list(regions_ar)
-    err_msg = "Wrong number of regions after split, expected: "
-    err_msg += "{}, found: {}".format(len(expected), len(regions))
-    assert len(regions) == len(expected), err_msg
-    err_msg = "Wrong number of regions after AudioRegion.split, expected: "
-    err_msg += "{}, found: {}".format(len(expected), len(regions_ar))
-    assert len(regions_ar) == len(expected), err_msg
+    _check_split_regions(regions, regions_ar, expected, data, 2 * channels)
 
-    sample_width = 2
-    sample_size_bytes = sample_width * channels
-    for reg, reg_ar, exp in zip(
-        regions,
-        regions_ar,
-        expected,
-    ):
-        onset, offset = exp
-        exp_data = data[onset * sample_size_bytes : offset * sample_size_bytes]
-        assert bytes(reg) == exp_data
-        assert reg == reg_ar
 
+def test_split_custom_validator(mono_raw, mono_region):
+    data = mono_raw
 
-def test_split_custom_validator():
-    filename = "tests/data/test_split_10HZ_mono.raw"
-    with open(filename, "rb") as fp:
-        data = fp.read()
+    def validator(x):
+        return to_array(x, sample_width=2, channels=1)[0] >= 320
 
     regions = split(
         data,
@@ -993,10 +1045,10 @@ def test_split_custom_validator():
         sw=2,
         ch=1,
         analysis_window=0.1,
-        validator=lambda x: to_array(x, sample_width=2, channels=1)[0] >= 320,
+        validator=validator,
     )
 
-    region = AudioRegion(data, 10, 2, 1)
+    region = mono_region
     regions_ar = region.split(
         min_dur=0.2,
         max_dur=5,
@@ -1004,33 +1056,15 @@ def test_split_custom_validator():
         drop_trailing_silence=False,
         strict_min_dur=False,
         analysis_window=0.1,
-        validator=lambda x: to_array(x, sample_width=2, channels=1)[0] >= 320,
+        validator=validator,
     )
 
     expected = [(2, 16), (17, 31), (34, 76)]
-    regions = list(regions)
-    regions_ar = list(regions_ar)
-    err_msg = "Wrong number of regions after split, expected: "
-    err_msg += "{}, found: {}".format(len(expected), len(regions))
-    assert len(regions) == len(expected), err_msg
-    err_msg = "Wrong number of regions after AudioRegion.split, expected: "
-    err_msg += "{}, found: {}".format(len(expected), len(regions_ar))
-    assert len(regions_ar) == len(expected), err_msg
-
-    sample_size_bytes = 2
-    for reg, reg_ar, exp in zip(
-        regions,
-        regions_ar,
-        expected,
-    ):
-        onset, offset = exp
-        exp_data = data[onset * sample_size_bytes : offset * sample_size_bytes]
-        assert bytes(reg) == exp_data
-        assert reg == reg_ar
+    _check_split_regions(regions, regions_ar, expected, data, 2)
 
 
 @pytest.mark.parametrize(
-    "input, kwargs",
+    "split_input, kwargs",
     [
         (
             "tests/data/test_split_10HZ_stereo.raw",
@@ -1048,35 +1082,10 @@ def test_split_custom_validator():
             "tests/data/test_split_10HZ_stereo.raw",
             {"sampling_rate": 10, "sample_width": 2, "channels": 2},
         ),  # filename_no_long_audio_params
-        (
-            open("tests/data/test_split_10HZ_stereo.raw", "rb").read(),
-            {"sr": 10, "sw": 2, "ch": 2},
-        ),  # bytes_
-        (
-            AudioReader(
-                "tests/data/test_split_10HZ_stereo.raw",
-                sr=10,
-                sw=2,
-                ch=2,
-                block_dur=0.1,
-            ),
-            {},
-        ),  # audio_reader
-        (
-            AudioRegion(
-                open("tests/data/test_split_10HZ_stereo.raw", "rb").read(),
-                10,
-                2,
-                2,
-            ),
-            {},
-        ),  # audio_region
-        (
-            get_audio_source(
-                "tests/data/test_split_10HZ_stereo.raw", sr=10, sw=2, ch=2
-            ),
-            {},
-        ),  # audio_source
+        ("bytes", {"sr": 10, "sw": 2, "ch": 2}),  # bytes_
+        ("audio_reader", {}),  # audio_reader
+        ("audio_region", {}),  # audio_region
+        ("audio_source", {}),  # audio_source
     ],
     ids=[
         "filename_audio_format",
@@ -1088,14 +1097,13 @@ def test_split_custom_validator():
         "audio_region",
         "audio_source",
     ],
+    indirect=["split_input"],
 )
-def test_split_input_type(input, kwargs):
-
-    with open("tests/data/test_split_10HZ_stereo.raw", "rb") as fp:
-        data = fp.read()
+def test_split_input_type(split_input, kwargs, stereo_raw):
+    data = memoryview(stereo_raw)
 
     regions = split(
-        input,
+        split_input,
         min_dur=0.2,
         max_dur=5,
         max_silence=0.2,
@@ -1116,89 +1124,74 @@ def test_split_input_type(input, kwargs):
     ):
         onset, offset = exp
         exp_data = data[onset * sample_width * 2 : offset * sample_width * 2]
-        assert bytes(reg) == exp_data
+        assert memoryview(reg.data) == exp_data
 
 
 @pytest.mark.parametrize(
-    "min_dur, max_dur, analysis_window",
+    "min_dur, max_dur, max_silence, expected_err_msg",
     [
-        (0.5, 0.4, 0.1),
-        (0.44, 0.49, 0.1),
+        (
+            0.5,
+            0.4,
+            0.2,
+            "'min_dur' (0.5 sec.) results in 5 analysis window(s) "
+            "(5 == ceil(0.5 / 0.1)) which is higher than the number of "
+            "analysis window(s) for 'max_dur' (4 == floor(0.4 / 0.1))",
+        ),  # min_dur_greater_than_max_dur
+        (
+            0.44,
+            0.49,
+            0.2,
+            "'min_dur' (0.44 sec.) results in 5 analysis window(s) "
+            "(5 == ceil(0.44 / 0.1)) which is higher than the number of "
+            "analysis window(s) for 'max_dur' (4 == floor(0.49 / 0.1))",
+        ),  # min_dur_durations_OK_but_wrong_number_of_analysis_windows
+        (
+            0.2,
+            0.5,
+            0.5,
+            "'max_silence' (0.5 sec.) results in 5 analysis window(s) "
+            "(5 == floor(0.5 / 0.1)) which is higher or equal to the number "
+            "of analysis window(s) for 'max_dur' (5 == floor(0.5 / 0.1))",
+        ),  # max_silence_equals_max_dur
+        (
+            0.2,
+            0.4,
+            0.5,
+            "'max_silence' (0.5 sec.) results in 5 analysis window(s) "
+            "(5 == floor(0.5 / 0.1)) which is higher or equal to the number "
+            "of analysis window(s) for 'max_dur' (4 == floor(0.4 / 0.1))",
+        ),  # max_silence_greater_than_max_dur
+        (
+            0.2,
+            0.49,
+            0.44,
+            "'max_silence' (0.44 sec.) results in 4 analysis window(s) "
+            "(4 == floor(0.44 / 0.1)) which is higher or equal to the number "
+            "of analysis window(s) for 'max_dur' (4 == floor(0.49 / 0.1))",
+        ),  # max_silence_durations_OK_but_wrong_number_of_analysis_windows
     ],
     ids=[
         "min_dur_greater_than_max_dur",
-        "durations_OK_but_wrong_number_of_analysis_windows",
-    ],
-)
-def test_split_wrong_min_max_dur(min_dur, max_dur, analysis_window):
-
-    with pytest.raises(ValueError) as val_err:
-        split(
-            b"0" * 16,
-            min_dur=min_dur,
-            max_dur=max_dur,
-            max_silence=0.2,
-            sr=16000,
-            sw=1,
-            ch=1,
-            analysis_window=analysis_window,
-        )
-
-    err_msg = "'min_dur' ({0} sec.) results in {1} analysis "
-    err_msg += "window(s) ({1} == ceil({0} / {2})) which is "
-    err_msg += "higher than the number of analysis window(s) for "
-    err_msg += "'max_dur' ({3} == floor({4} / {2}))"
-
-    err_msg = err_msg.format(
-        min_dur,
-        math.ceil(min_dur / analysis_window),
-        analysis_window,
-        math.floor(max_dur / analysis_window),
-        max_dur,
-    )
-    assert err_msg == str(val_err.value)
-
-
-@pytest.mark.parametrize(
-    "max_silence, max_dur, analysis_window",
-    [
-        (0.5, 0.5, 0.1),  # max_silence_equals_max_dur
-        (0.5, 0.4, 0.1),  # max_silence_greater_than_max_dur
-        (0.44, 0.49, 0.1),  # durations_OK_but_wrong_number_of_analysis_windows
-    ],
-    ids=[
+        "min_dur_durations_OK_but_wrong_number_of_analysis_windows",
         "max_silence_equals_max_dur",
         "max_silence_greater_than_max_dur",
-        "durations_OK_but_wrong_number_of_analysis_windows",
+        "max_silence_durations_OK_but_wrong_number_of_analysis_windows",
     ],
 )
-def test_split_wrong_max_silence_max_dur(max_silence, max_dur, analysis_window):
-
+def test_split_wrong_durations(min_dur, max_dur, max_silence, expected_err_msg):
     with pytest.raises(ValueError) as val_err:
         split(
             b"0" * 16,
-            min_dur=0.2,
+            min_dur=min_dur,
             max_dur=max_dur,
             max_silence=max_silence,
             sr=16000,
             sw=1,
             ch=1,
-            analysis_window=analysis_window,
+            analysis_window=0.1,
         )
-
-    err_msg = "'max_silence' ({0} sec.) results in {1} analysis "
-    err_msg += "window(s) ({1} == floor({0} / {2})) which is "
-    err_msg += "higher or equal to the number of analysis window(s) for "
-    err_msg += "'max_dur' ({3} == floor({4} / {2}))"
-
-    err_msg = err_msg.format(
-        max_silence,
-        math.floor(max_silence / analysis_window),
-        analysis_window,
-        math.floor(max_dur / analysis_window),
-        max_dur,
-    )
-    assert err_msg == str(val_err.value)
+    assert str(val_err.value) == expected_err_msg
 
 
 @pytest.mark.parametrize(
@@ -1251,12 +1244,9 @@ def test_split_too_small_analysis_window():
     assert err_msg == str(val_err.value)
 
 
-def test_split_and_plot():
-
-    with open("tests/data/test_split_10HZ_mono.raw", "rb") as fp:
-        data = fp.read()
-
-    region = AudioRegion(data, 10, 2, 1)
+def test_split_and_plot(mono_raw, mono_region):
+    data = mono_raw
+    region = mono_region
     with patch("auditok.core.plot") as patch_fn:
         regions = region.split_and_plot(
             min_dur=0.2,
@@ -1281,25 +1271,21 @@ def test_split_and_plot():
     assert regions == expected_regions
 
 
-def test_split_exception():
-    with open("tests/data/test_split_10HZ_mono.raw", "rb") as fp:
-        data = fp.read()
-        region = AudioRegion(data, 10, 2, 1)
-
+def test_split_exception(mono_region):
     with pytest.raises(RuntimeWarning):
         # max_read is not accepted when calling AudioRegion.split
-        region.split(max_read=2)
+        mono_region.split(max_read=2)
 
 
 @pytest.mark.parametrize(
     (
-        "data, start, sampling_rate, sample_width, channels, expected_end, "
+        "nb_bytes, start, sampling_rate, sample_width, channels, expected_end, "
         + "expected_duration_s, expected_duration_ms"
     ),
     [
-        (b"\0" * 8000, 0, 8000, 1, 1, 1, 1, 1000),  # simple
+        (8000, 0, 8000, 1, 1, 1, 1, 1000),  # simple
         (
-            b"\0" * 7992,
+            7992,
             0,
             8000,
             1,
@@ -1309,7 +1295,7 @@ def test_split_exception():
             999,
         ),  # one_ms_less_than_1_sec
         (
-            b"\0" * 7994,
+            7994,
             0,
             8000,
             1,
@@ -1319,7 +1305,7 @@ def test_split_exception():
             999,
         ),  # tree_quarter_ms_less_than_1_sec
         (
-            b"\0" * 7996,
+            7996,
             0,
             8000,
             1,
@@ -1329,7 +1315,7 @@ def test_split_exception():
             1000,
         ),  # half_ms_less_than_1_sec
         (
-            b"\0" * 7998,
+            7998,
             0,
             8000,
             1,
@@ -1338,11 +1324,11 @@ def test_split_exception():
             0.99975,
             1000,
         ),  # quarter_ms_less_than_1_sec
-        (b"\0" * 8000 * 2, 0, 8000, 2, 1, 1, 1, 1000),  # simple_sample_width_2
-        (b"\0" * 8000 * 2, 0, 8000, 1, 2, 1, 1, 1000),  # simple_stereo
-        (b"\0" * 8000 * 5, 0, 8000, 1, 5, 1, 1, 1000),  # simple_multichannel
+        (8000 * 2, 0, 8000, 2, 1, 1, 1, 1000),  # simple_sample_width_2
+        (8000 * 2, 0, 8000, 1, 2, 1, 1, 1000),  # simple_stereo
+        (8000 * 5, 0, 8000, 1, 5, 1, 1, 1000),  # simple_multichannel
         (
-            b"\0" * 8000 * 2 * 5,
+            8000 * 2 * 5,
             0,
             8000,
             2,
@@ -1352,7 +1338,7 @@ def test_split_exception():
             1000,
         ),  # simple_sample_width_2_multichannel
         (
-            b"\0" * 7992 * 2 * 5,
+            7992 * 2 * 5,
             0,
             8000,
             2,
@@ -1362,7 +1348,7 @@ def test_split_exception():
             999,
         ),  # one_ms_less_than_1s_sw_2_multichannel
         (
-            b"\0" * 7994 * 2 * 5,
+            7994 * 2 * 5,
             0,
             8000,
             2,
@@ -1372,7 +1358,7 @@ def test_split_exception():
             999,
         ),  # tree_qrt_ms_lt_1_s_sw_2_multichannel
         (
-            b"\0" * 7996 * 2 * 5,
+            7996 * 2 * 5,
             0,
             8000,
             2,
@@ -1382,7 +1368,7 @@ def test_split_exception():
             1000,
         ),  # half_ms_lt_1s_sw_2_multichannel
         (
-            b"\0" * 7998 * 2 * 5,
+            7998 * 2 * 5,
             0,
             8000,
             2,
@@ -1392,7 +1378,7 @@ def test_split_exception():
             1000,
         ),  # quarter_ms_lt_1s_sw_2_multichannel
         (
-            b"\0" * int(8000 * 1.33),
+            int(8000 * 1.33),
             2.7,
             8000,
             1,
@@ -1402,7 +1388,7 @@ def test_split_exception():
             1330,
         ),  # arbitrary_length_1
         (
-            b"\0" * int(8000 * 0.476),
+            int(8000 * 0.476),
             11.568,
             8000,
             1,
@@ -1412,7 +1398,7 @@ def test_split_exception():
             476,
         ),  # arbitrary_length_2
         (
-            b"\0" * int(8000 * 1.711) * 2 * 3,
+            int(8000 * 1.711) * 2 * 3,
             9.415,
             8000,
             2,
@@ -1422,7 +1408,7 @@ def test_split_exception():
             1711,
         ),  # arbitrary_length_sw_2_multichannel
         (
-            b"\0" * int(3172 * 1.318),
+            int(3172 * 1.318),
             17.236,
             3172,
             1,
@@ -1432,7 +1418,7 @@ def test_split_exception():
             1318,
         ),  # arbitrary_sampling_rate
         (
-            b"\0" * int(11317 * 0.716) * 2 * 3,
+            int(11317 * 0.716) * 2 * 3,
             18.811,
             11317,
             2,
@@ -1464,7 +1450,7 @@ def test_split_exception():
     ],
 )
 def test_creation(
-    data,
+    nb_bytes,
     start,
     sampling_rate,
     sample_width,
@@ -1473,6 +1459,7 @@ def test_creation(
     expected_duration_s,
     expected_duration_ms,
 ):
+    data = bytes(nb_bytes)
     region = AudioRegion(data, sampling_rate, sample_width, channels, start)
     assert region.sampling_rate == sampling_rate
     assert region.sr == sampling_rate
@@ -1519,7 +1506,7 @@ def test_creation_invalid_data_exception():
         "skip_2_4_read_3_5_stereo",
     ],
 )
-def test_load_AudioRegion(skip, max_read, channels):
+def test_load_AudioRegion(skip, max_read, channels, mono_raw, stereo_raw):
     sampling_rate = 10
     sample_width = 2
     filename = "tests/data/test_split_10HZ_{}.raw"
@@ -1532,13 +1519,13 @@ def test_load_AudioRegion(skip, max_read, channels):
         sw=sample_width,
         ch=channels,
     )
-    with open(filename, "rb") as fp:
-        fp.read(round(skip * sampling_rate * sample_width * channels))
-        if max_read is None or max_read < 0:
-            to_read = -1
-        else:
-            to_read = round(max_read * sampling_rate * sample_width * channels)
-        expected = fp.read(to_read)
+    data = mono_raw if channels == 1 else stereo_raw
+    onset = _nb_bytes(skip, sampling_rate, sample_width, channels)
+    if max_read is None or max_read < 0:
+        expected = data[onset:]
+    else:
+        to_read = _nb_bytes(max_read, sampling_rate, sample_width, channels)
+        expected = data[onset : onset + to_read]
     assert bytes(region) == expected
 
 
@@ -1627,11 +1614,11 @@ def test_load_from_microphone_with_nonzero_skip_exception():
     ],
 )
 def test_save(format, start, expected):
-    with TemporaryDirectory() as tmpdir:
-        region = AudioRegion(b"0" * 160, 160, 1, 1, start)
-        format = os.path.join(tmpdir, format)
-        filename = region.save(format)[len(tmpdir) + 1 :]
-        assert filename == expected
+    region = AudioRegion(b"0" * 160, 160, 1, 1, start)
+    with patch("auditok.core.to_file") as patched_to_file:
+        filename = region.save(format)
+    assert filename == expected
+    assert patched_to_file.call_args[0][1] == expected
 
 
 def test_save_file_exists_exception():
@@ -1664,7 +1651,7 @@ def test_save_file_exists_exception():
 def test_join(sampling_rate, sample_width, channels):
     duration = 1
     size = int(duration * sampling_rate * sample_width * channels)
-    glue_data = b"\0" * size
+    glue_data = bytes(size)
     regions_data = [
         b"\1" * int(size * 1.5),
         b"\2" * int(size * 0.5),
@@ -1704,7 +1691,7 @@ def test_join_exception(sampling_rate, sample_width, channels):
     size = int(
         duration * glue_sampling_rate * glue_sample_width * glue_channels
     )
-    glue_data = b"\0" * size
+    glue_data = bytes(size)
     glue_region = AudioRegion(
         glue_data, glue_sampling_rate, glue_sample_width, glue_channels
     )
@@ -1725,105 +1712,105 @@ def test_join_exception(sampling_rate, sample_width, channels):
 
 
 @pytest.mark.parametrize(
-    "region, slice_, expected_data",
+    "region_args, slice_, expected_data",
     [
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(0, 500),
             b"a" * 80,  # first_half
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(500, None),
             b"b" * 80,  # second_half
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(-500, None),
             b"b" * 80,  # second_half_negative
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(200, 750),
             b"a" * 48 + b"b" * 40,  # middle
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(-800, -250),
             b"a" * 48 + b"b" * 40,  # middle_negative
         ),
         (
-            AudioRegion(b"a" * 160 + b"b" * 160, 160, 2, 1),
+            (160, 160, 160, 2, 1),
             slice(200, 750),
             b"a" * 96 + b"b" * 80,  # middle_sw2
         ),
         (
-            AudioRegion(b"a" * 160 + b"b" * 160, 160, 1, 2),
+            (160, 160, 160, 1, 2),
             slice(200, 750),
             b"a" * 96 + b"b" * 80,  # middle_ch2
         ),
         (
-            AudioRegion(b"a" * 320 + b"b" * 320, 160, 2, 2),
+            (320, 320, 160, 2, 2),
             slice(200, 750),
             b"a" * 192 + b"b" * 160,  # middle_sw2_ch2
         ),
         (
-            AudioRegion(b"a" * 4000 + b"b" * 4000, 8000, 1, 1),
+            (4000, 4000, 8000, 1, 1),
             slice(1, None),
             b"a" * (4000 - 8) + b"b" * 4000,  # but_first_sample
         ),
         (
-            AudioRegion(b"a" * 4000 + b"b" * 4000, 8000, 1, 1),
+            (4000, 4000, 8000, 1, 1),
             slice(-999, None),
             b"a" * (4000 - 8) + b"b" * 4000,  # but_first_sample_negative
         ),
         (
-            AudioRegion(b"a" * 4000 + b"b" * 4000, 8000, 1, 1),
+            (4000, 4000, 8000, 1, 1),
             slice(0, 999),
             b"a" * 4000 + b"b" * (4000 - 8),  # but_last_sample
         ),
         (
-            AudioRegion(b"a" * 4000 + b"b" * 4000, 8000, 1, 1),
+            (4000, 4000, 8000, 1, 1),
             slice(0, -1),
             b"a" * 4000 + b"b" * (4000 - 8),  # but_last_sample_negative
         ),
         (
-            AudioRegion(b"a" * 160, 160, 1, 1),
+            (160, 0, 160, 1, 1),
             slice(-5000, None),
             b"a" * 160,  # big_negative_start
         ),
         (
-            AudioRegion(b"a" * 160, 160, 1, 1),
+            (160, 0, 160, 1, 1),
             slice(None, -1500),
             b"",  # big_negative_stop
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(0, 0),
             b"",  # empty
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(200, 100),
             b"",  # empty_start_stop_reversed
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(2000, 3000),
             b"",  # empty_big_positive_start
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(-100, -200),
             b"",  # empty_negative_reversed
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(0, -2000),
             b"",  # empty_big_negative_stop
         ),
         (
-            AudioRegion(b"a" * 124 + b"b" * 376, 1234, 1, 1),
+            (124, 376, 1234, 1, 1),
             slice(100, 200),
             b"a" + b"b" * 123,  # arbitrary_sampling_rate
         ),
@@ -1851,7 +1838,8 @@ def test_join_exception(sampling_rate, sample_width, channels):
         "arbitrary_sampling_rate",
     ],
 )
-def test_region_temporal_slicing(region, slice_, expected_data):
+def test_region_temporal_slicing(region_args, slice_, expected_data):
+    region = _make_ab_region(*region_args)
     sub_region = region.millis[slice_]
     assert bytes(sub_region) == expected_data
     start_sec = slice_.start / 1000 if slice_.start is not None else None
@@ -1861,130 +1849,130 @@ def test_region_temporal_slicing(region, slice_, expected_data):
 
 
 @pytest.mark.parametrize(
-    "region, slice_, time_shift, expected_data",
+    "region_args, slice_, time_shift, expected_data",
     [
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(0, 80),
             0,
             b"a" * 80,  # first_half
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(80, None),
             0.5,
             b"b" * 80,  # second_half
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(-80, None),
             0.5,
             b"b" * 80,  # second_half_negative
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(160 // 5, 160 // 4 * 3),
             0.2,
             b"a" * 48 + b"b" * 40,  # middle
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(-160 // 5 * 4, -160 // 4),
             0.2,
             b"a" * 48 + b"b" * 40,  # middle_negative
         ),
         (
-            AudioRegion(b"a" * 160 + b"b" * 160, 160, 2, 1),
+            (160, 160, 160, 2, 1),
             slice(160 // 5, 160 // 4 * 3),
             0.2,
             b"a" * 96 + b"b" * 80,  # middle_sw2
         ),
         (
-            AudioRegion(b"a" * 160 + b"b" * 160, 160, 1, 2),
+            (160, 160, 160, 1, 2),
             slice(160 // 5, 160 // 4 * 3),
             0.2,
             b"a" * 96 + b"b" * 80,  # middle_ch2
         ),
         (
-            AudioRegion(b"a" * 320 + b"b" * 320, 160, 2, 2),
+            (320, 320, 160, 2, 2),
             slice(160 // 5, 160 // 4 * 3),
             0.2,
             b"a" * 192 + b"b" * 160,  # middle_sw2_ch2
         ),
         (
-            AudioRegion(b"a" * 4000 + b"b" * 4000, 8000, 1, 1),
+            (4000, 4000, 8000, 1, 1),
             slice(1, None),
             1 / 8000,
             b"a" * (4000 - 1) + b"b" * 4000,  # but_first_sample
         ),
         (
-            AudioRegion(b"a" * 4000 + b"b" * 4000, 8000, 1, 1),
+            (4000, 4000, 8000, 1, 1),
             slice(-7999, None),
             1 / 8000,
             b"a" * (4000 - 1) + b"b" * 4000,  # but_first_sample_negative
         ),
         (
-            AudioRegion(b"a" * 4000 + b"b" * 4000, 8000, 1, 1),
+            (4000, 4000, 8000, 1, 1),
             slice(0, 7999),
             0,
             b"a" * 4000 + b"b" * (4000 - 1),  # but_last_sample
         ),
         (
-            AudioRegion(b"a" * 4000 + b"b" * 4000, 8000, 1, 1),
+            (4000, 4000, 8000, 1, 1),
             slice(0, -1),
             0,
             b"a" * 4000 + b"b" * (4000 - 1),  # but_last_sample_negative
         ),
         (
-            AudioRegion(b"a" * 160, 160, 1, 1),
+            (160, 0, 160, 1, 1),
             slice(-1600, None),
             0,
             b"a" * 160,  # big_negative_start
         ),
         (
-            AudioRegion(b"a" * 160, 160, 1, 1),
+            (160, 0, 160, 1, 1),
             slice(None, -1600),
             0,
             b"",  # big_negative_stop
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(0, 0),
             0,
             b"",  # empty
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(80, 40),
             0.5,
             b"",  # empty_start_stop_reversed
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(1600, 3000),
             10,
             b"",  # empty_big_positive_start
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(-16, -32),
             0.9,
             b"",  # empty_negative_reversed
         ),
         (
-            AudioRegion(b"a" * 80 + b"b" * 80, 160, 1, 1),
+            (80, 80, 160, 1, 1),
             slice(0, -2000),
             0,
             b"",  # empty_big_negative_stop
         ),
         (
-            AudioRegion(b"a" * 124 + b"b" * 376, 1235, 1, 1),
+            (124, 376, 1235, 1, 1),
             slice(100, 200),
             100 / 1235,
             b"a" * 24 + b"b" * 76,  # arbitrary_sampling_rate
         ),
         (
-            AudioRegion(b"a" * 124 + b"b" * 376, 1235, 2, 2),
+            (124, 376, 1235, 2, 2),
             slice(25, 50),
             25 / 1235,
             b"a" * 24 + b"b" * 76,  # arbitrary_sampling_rate_middle_sw2_ch2
@@ -2014,7 +2002,8 @@ def test_region_temporal_slicing(region, slice_, expected_data):
         "arbitrary_sampling_rate_middle_sw2_ch2",
     ],
 )
-def test_region_sample_slicing(region, slice_, time_shift, expected_data):
+def test_region_sample_slicing(region_args, slice_, time_shift, expected_data):
+    region = _make_ab_region(*region_args)
     sub_region = region[slice_]
     assert bytes(sub_region) == expected_data
 
@@ -2069,6 +2058,9 @@ def test_concatenation_many(sampling_rate, sample_width, channels):
     assert concat_region.duration == pytest.approx(expected_duration, abs=1e-6)
     assert bytes(concat_region) == expected_data
 
+    empty_region = AudioRegion(b"", sampling_rate, sample_width, channels)
+    assert empty_region.join(regions) == concat_region
+
 
 def test_concatenation_different_sampling_rate_error():
     region_1 = AudioRegion(b"a" * 100, 8000, 1, 1)
@@ -2171,24 +2163,18 @@ def test_multiplication_non_int(factor, _type):
     ],
 )
 def test_truediv(data):
-
     region = AudioRegion(b"".join(data), 80, 1, 1)
-
     sub_regions = region / len(data)
-    for data_i, region in zip(
-        data,
-        sub_regions,
-    ):
-        assert len(data_i) == len(bytes(region))
+    assert [bytes(sub_region) for sub_region in sub_regions] == data
 
 
 @pytest.mark.parametrize(
     "data, sample_width, channels, expected",
     [
-        (b"a" * 10, 1, 1, [97] * 10),  # mono_sw_1
-        (b"a" * 10, 2, 1, [24929] * 5),  # mono_sw_2
-        (b"a" * 8, 4, 1, [1633771873] * 2),  # mono_sw_4
-        (b"ab" * 5, 1, 2, [[97] * 5, [98] * 5]),  # stereo_sw_1
+        (b"a" * 10, 1, 1, np.full((1, 10), 97)),  # mono_sw_1
+        (b"a" * 10, 2, 1, np.full((1, 5), 24929)),  # mono_sw_2
+        (b"a" * 8, 4, 1, np.full((1, 2), 1633771873)),  # mono_sw_4
+        (b"ab" * 5, 1, 2, np.repeat([[97], [98]], 5, axis=1)),  # stereo_sw_1
     ],
     ids=[
         "mono_sw_1",
@@ -2198,9 +2184,10 @@ def test_truediv(data):
     ],
 )
 def test_samples(data, sample_width, channels, expected):
-
     region = AudioRegion(data, 10, sample_width, channels)
-    expected = np.array(expected)
-    assert (region.samples == expected).all()
-    assert (region.numpy() == expected).all()
-    assert (np.array(region) == expected).all()
+    samples = region.numpy()
+    assert np.array_equal(samples, expected)
+    # `samples` and `__array__` are thin wrappers around `numpy()`
+    with pytest.warns(DeprecationWarning):
+        assert np.array_equal(region.samples, samples)
+    assert np.array_equal(np.asarray(region), samples)